@@ -1,3 +1,67 @@
+from enum import IntEnum
+from functools import lru_cache
+
+class PT(IntEnum):
+    """Piece types; strings are converted once at the input boundary."""
+    ROOK = 0
+    BISHOP = 1
+    KNIGHT = 2
+    QUEEN = 3
+    KING = 4
+
+
+# Lowercase piece names indexed by PT, for display
+PIECE_NAMES = ('rook', 'bishop', 'knight', 'queen', 'king')
+
+
+def _piece_type(piece):
+    """Return piece as a PT, accepting a PT or a piece name in any case."""
+    return piece if isinstance(piece, PT) else PT[piece.upper()]
+
+
+# Square index row * 8 + col <-> chess notation, for both letter cases
+SQ_TO_POS = tuple(f"{chr(ord('a') + col)}{row + 1}" for row in range(8) for col in range(8))
+POS_TO_SQ = {**{pos: sq for sq, pos in enumerate(SQ_TO_POS)},
+             **{pos.upper(): sq for sq, pos in enumerate(SQ_TO_POS)}}
+
+KNIGHT_OFFSETS = (
+    (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+    (1, -2), (1, 2), (2, -1), (2, 1)
+)
+KING_OFFSETS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1)
+)
+
+
+def _build_attack_table(offsets):
+    """Precompute in-bounds target squares for a fixed-offset piece, indexed by row * 8 + col."""
+    return tuple(
+        tuple((row + dr, col + dc) for dr, dc in offsets
+              if 0 <= row + dr <= 7 and 0 <= col + dc <= 7)
+        for row in range(8) for col in range(8)
+    )
+
+
+KNIGHT_ATTACKS = _build_attack_table(KNIGHT_OFFSETS)
+KING_ATTACKS = _build_attack_table(KING_OFFSETS)
+
+ROOK_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _slide(row, col, directions):
+    """Squares a slider reaches along each ray on an otherwise empty board."""
+    moves = []
+    for dr, dc in directions:
+        r, c = row + dr, col + dc
+        while 0 <= r <= 7 and 0 <= c <= 7:
+            moves.append((r, c))
+            r, c = r + dr, c + dc
+    return moves
+
+
 class Chess:
     """
     1. Encapsulates the core rules mechanics of chess piece movements and attacks.
@@ -14,114 +78,82 @@ class Chess:
 
     @staticmethod
     def position_to_coords(position):
-        """Convert chess notation (e.g., 'e4') to row, col coordinates."""
-        if len(position) != 2:
-            raise ValueError("Invalid position format")
-        col = ord(position[0].lower()) - ord('a')
-        row = int(position[1]) - 1
-        return row, col
+        """Convert chess notation (e.g., 'e4') to row, col coordinates.
+
+        Raises ValueError for anything that is not a square on the board, e.g. 'e9'.
+        """
+        try:
+            return divmod(POS_TO_SQ[position], 8)
+        except KeyError:
+            raise ValueError("Invalid position format") from None
 
     @staticmethod
     def coords_to_position(row, col):
         """Convert row, col coordinates to chess notation."""
-        return chr(ord('a') + col) + str(row + 1)
+        return SQ_TO_POS[row * 8 + col]
 
     @classmethod
     def get_piece_moves(cls, piece_type, position, color='white'):
         """Get all possible moves for a piece at given position."""
-        row, col = cls.position_to_coords(position)
-        piece_type = piece_type.lower()
-
-        moves = []
-
-        if piece_type == 'rook':
-            moves = cls._get_rook_moves(row, col)
-        elif piece_type == 'bishop':
-            moves = cls._get_bishop_moves(row, col)
-        elif piece_type == 'queen':
-            moves = cls._get_queen_moves(row, col)
-        elif piece_type == 'knight':
-            moves = cls._get_knight_moves(row, col)
-        elif piece_type == 'king':
-            moves = cls._get_king_moves(row, col)
-
-        return [cls.coords_to_position(r, c) for r, c in moves if cls.is_valid_position(r, c)]
+        return _moves_cached(_piece_type(piece_type), position)
 
     @classmethod
-    def _get_rook_moves(cls, row, col):
-        """Get rook moves (horizontal and vertical)."""
-        moves = []
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+    def _compute_moves(cls, piece_type, position):
+        """Uncached move generation behind get_piece_moves."""
+        row, col = cls.position_to_coords(position)
+        moves = cls._DISPATCH[piece_type](row, col)
 
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row, new_col = row + dr * i, col + dc * i
-                if cls.is_valid_position(new_row, new_col):
-                    moves.append((new_row, new_col))
-                else:
-                    break
+        # Generators only produce in-bounds squares, so no re-filtering is needed
+        assert all(cls.is_valid_position(r, c) for r, c in moves)
+        return frozenset(SQ_TO_POS[r * 8 + c] for r, c in moves)
 
-        return moves
+    @staticmethod
+    def _get_rook_moves(row, col):
+        """Get rook moves (horizontal and vertical)."""
+        return _slide(row, col, ROOK_DIRECTIONS)
 
-    @classmethod
-    def _get_bishop_moves(cls, row, col):
+    @staticmethod
+    def _get_bishop_moves(row, col):
         """Get bishop moves (diagonal)."""
-        moves = []
-        directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row, new_col = row + dr * i, col + dc * i
-                if cls.is_valid_position(new_row, new_col):
-                    moves.append((new_row, new_col))
-                else:
-                    break
+        return _slide(row, col, BISHOP_DIRECTIONS)
 
-        return moves
-
-    @classmethod
-    def _get_queen_moves(cls, row, col):
+    @staticmethod
+    def _get_queen_moves(row, col):
         """Get queen moves (combination of rook and bishop)."""
-        return cls._get_rook_moves(row, col) + cls._get_bishop_moves(row, col)
+        return _slide(row, col, ROOK_DIRECTIONS + BISHOP_DIRECTIONS)
 
-    @classmethod
-    def _get_knight_moves(cls, row, col):
+    @staticmethod
+    def _get_knight_moves(row, col):
         """Get knight moves (L-shaped)."""
-        moves = []
-        knight_moves = [
-            (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-            (1, -2), (1, 2), (2, -1), (2, 1)
-        ]
+        return KNIGHT_ATTACKS[row * 8 + col]
 
-        for dr, dc in knight_moves:
-            new_row, new_col = row + dr, col + dc
-            if cls.is_valid_position(new_row, new_col):
-                moves.append((new_row, new_col))
-
-        return moves
-
-    @classmethod
-    def _get_king_moves(cls, row, col):
+    @staticmethod
+    def _get_king_moves(row, col):
         """Get king moves (one square in any direction)."""
-        moves = []
-        directions = [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1),           (0, 1),
-            (1, -1),  (1, 0),  (1, 1)
-        ]
-
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-            if cls.is_valid_position(new_row, new_col):
-                moves.append((new_row, new_col))
-
-        return moves
+        return KING_ATTACKS[row * 8 + col]
 
     @classmethod
     def can_attack(cls, piece_type, from_pos, target_pos, color='white'):
         """Check if a piece can attack a target position."""
-        possible_moves = cls.get_piece_moves(piece_type, from_pos, color)
-        return target_pos in possible_moves
+        return target_pos in _moves_cached(_piece_type(piece_type), from_pos)
+
+
+# Move generator for each piece type; unknown pieces raise KeyError.  Filled in
+# after the class body so the entries are plain functions, not staticmethod objects
+Chess._DISPATCH = {
+    PT.ROOK: Chess._get_rook_moves,
+    PT.BISHOP: Chess._get_bishop_moves,
+    PT.QUEEN: Chess._get_queen_moves,
+    PT.KNIGHT: Chess._get_knight_moves,
+    PT.KING: Chess._get_king_moves,
+}
+
+# Moves only depend on piece type and square (color is ignored), so at most
+# 5 * 128 distinct results exist (positions are accepted in either letter case)
+@lru_cache(maxsize=4096)
+def _moves_cached(piece_type, position):
+    """Cached Chess._compute_moves; the returned frozenset is shared between callers."""
+    return Chess._compute_moves(piece_type, position)
 
 
 class MyChessGame:
@@ -132,35 +164,39 @@ class MyChessGame:
     4. Determines which piece has a higher likelihood of winning and provides possible moves accordingly.
     """
 
+    __slots__ = ('white_piece', 'white_pos', 'black_piece', 'black_pos', 'white_value', 'black_value',
+                 '_white_type', '_black_type')
+
     def __init__(self, white_piece, white_pos, black_piece, black_pos):
         """Initialize game with two pieces."""
         self.white_piece = white_piece.lower()
         self.white_pos = white_pos.lower()
         self.black_piece = black_piece.lower()
         self.black_pos = black_pos.lower()
-        self.chess = Chess()
+        # PT versions for the move lookups, converted once here
+        self._white_type = _piece_type(self.white_piece)
+        self._black_type = _piece_type(self.black_piece)
+        self.white_value = Chess.PIECE_VALUES[self.white_piece]
+        self.black_value = Chess.PIECE_VALUES[self.black_piece]
 
     def can_white_attack_black(self):
         """Check if white piece can attack black piece."""
-        return self.chess.can_attack(self.white_piece, self.white_pos, self.black_pos, 'white')
+        return Chess.can_attack(self._white_type, self.white_pos, self.black_pos, 'white')
 
     def can_black_attack_white(self):
         """Check if black piece can attack white piece."""
-        return self.chess.can_attack(self.black_piece, self.black_pos, self.white_pos, 'black')
+        return Chess.can_attack(self._black_type, self.black_pos, self.white_pos, 'black')
 
     def get_white_moves(self):
-        """Get all possible moves for white piece."""
-        return self.chess.get_piece_moves(self.white_piece, self.white_pos, 'white')
+        """Get all possible moves for white piece, sorted by square name."""
+        return sorted(Chess.get_piece_moves(self._white_type, self.white_pos, 'white'))
 
     def get_black_moves(self):
-        """Get all possible moves for black piece."""
-        return self.chess.get_piece_moves(self.black_piece, self.black_pos, 'black')
+        """Get all possible moves for black piece, sorted by square name."""
+        return sorted(Chess.get_piece_moves(self._black_type, self.black_pos, 'black'))
 
     def determine_winner(self):
         """Determine winner based on attack potential and piece values."""
-        white_value = Chess.PIECE_VALUES[self.white_piece]
-        black_value = Chess.PIECE_VALUES[self.black_piece]
-
         white_can_attack = self.can_white_attack_black()
         black_can_attack = self.can_black_attack_white()
 
@@ -171,9 +207,9 @@ class MyChessGame:
             return f"black {self.black_piece} wins"
 
         # Otherwise, higher value piece wins
-        if white_value > black_value:
+        if self.white_value > self.black_value:
             return f"white {self.white_piece} wins"
-        elif black_value > white_value:
+        elif self.black_value > self.white_value:
             return f"black {self.black_piece} wins"
         else:
             return "draw"
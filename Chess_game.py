@@ -1,6 +1,158 @@
 import tkinter as tk
 from tkinter import messagebox
 import math
+from enum import IntEnum
+
+class PT(IntEnum):
+    ROOK = 0
+    BISHOP = 1
+    KNIGHT = 2
+    QUEEN = 3
+    KING = 4
+
+
+# Lowercase piece names indexed by PT, for display
+PIECE_NAMES = ('rook', 'bishop', 'knight', 'queen', 'king')
+
+
+# Square index row * 8 + col <-> chess notation, for both letter cases
+SQ_TO_POS = tuple(f"{chr(ord('a') + col)}{row + 1}" for row in range(8) for col in range(8))
+POS_TO_SQ = {**{pos: sq for sq, pos in enumerate(SQ_TO_POS)},
+             **{pos.upper(): sq for sq, pos in enumerate(SQ_TO_POS)}}
+
+KNIGHT_OFFSETS = (
+    (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+    (1, -2), (1, 2), (2, -1), (2, 1)
+)
+KING_OFFSETS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1)
+)
+
+
+def _build_attack_table(offsets):
+    return tuple(
+        tuple((row + dr, col + dc) for dr, dc in offsets
+              if 0 <= row + dr <= 7 and 0 <= col + dc <= 7)
+        for row in range(8) for col in range(8)
+    )
+
+
+KNIGHT_ATTACKS = _build_attack_table(KNIGHT_OFFSETS)
+KING_ATTACKS = _build_attack_table(KING_OFFSETS)
+
+ROOK_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _ray_attacks(row, col, directions, occupancy):
+    attacks = 0
+    for dr, dc in directions:
+        r, c = row + dr, col + dc
+        while 0 <= r <= 7 and 0 <= c <= 7:
+            bit = 1 << (r * 8 + c)
+            attacks |= bit
+            if occupancy & bit:
+                break
+            r, c = r + dr, c + dc
+    return attacks
+
+
+def _relevant_mask(row, col, directions):
+    mask = 0
+    for dr, dc in directions:
+        r, c = row + dr, col + dc
+        while 0 <= r + dr <= 7 and 0 <= c + dc <= 7:
+            mask |= 1 << (r * 8 + c)
+            r, c = r + dr, c + dc
+    return mask
+
+
+def _ray_table(row, col, direction):
+    mask = _relevant_mask(row, col, (direction,))
+    table = {}
+    # Walk every subset of the mask (carry-rippler), starting with the empty one
+    subset = 0
+    while True:
+        table[subset] = _ray_attacks(row, col, (direction,), subset)
+        subset = (subset - mask) & mask
+        if not subset:
+            break
+    return mask, table
+
+
+def _build_slider_tables(directions):
+    masks = []
+    tables = []
+    for row in range(8):
+        for col in range(8):
+            mask = 0
+            table = {0: 0}
+            for direction in directions:
+                ray_mask, ray = _ray_table(row, col, direction)
+                # Rays are disjoint, so the full table is the product of the per-ray ones
+                table = {occ | ray_occ: attacks | ray_attacks
+                         for occ, attacks in table.items()
+                         for ray_occ, ray_attacks in ray.items()}
+                mask |= ray_mask
+            masks.append(mask)
+            tables.append(table)
+    return tuple(masks), tables
+
+
+ROOK_MASK, ROOK_ATK = _build_slider_tables(ROOK_DIRECTIONS)
+BISHOP_MASK, BISHOP_ATK = _build_slider_tables(BISHOP_DIRECTIONS)
+
+
+def _rook_attacks(sq, occupancy):
+    return ROOK_ATK[sq][occupancy & ROOK_MASK[sq]]
+
+
+def _bishop_attacks(sq, occupancy):
+    return BISHOP_ATK[sq][occupancy & BISHOP_MASK[sq]]
+
+
+def _to_bitboard(squares):
+    bb = 0
+    for row, col in squares:
+        bb |= 1 << (row * 8 + col)
+    return bb
+
+
+# Same tables packed as bitboards, bit row * 8 + col set for each target square
+KNIGHT_ATK = tuple(_to_bitboard(targets) for targets in KNIGHT_ATTACKS)
+KING_ATK = tuple(_to_bitboard(targets) for targets in KING_ATTACKS)
+
+
+def _squares(bb):
+    while bb:
+        lsb = bb & -bb
+        yield lsb.bit_length() - 1
+        bb ^= lsb
+
+
+def _knight_attacks(sq, occupancy):
+    return KNIGHT_ATK[sq]
+
+
+def _king_attacks(sq, occupancy):
+    return KING_ATK[sq]
+
+
+def _queen_attacks(sq, occupancy):
+    return _rook_attacks(sq, occupancy) | _bishop_attacks(sq, occupancy)
+
+
+# Attack bitboard generator for each piece type, all called as f(sq, occupancy)
+ATTACKS = {
+    PT.ROOK: _rook_attacks,
+    PT.BISHOP: _bishop_attacks,
+    PT.QUEEN: _queen_attacks,
+    PT.KNIGHT: _knight_attacks,
+    PT.KING: _king_attacks,
+}
+
 
 class Chess:
     """
@@ -17,97 +169,31 @@ class Chess:
 
     @staticmethod
     def position_to_coords(position):
-        if len(position) != 2:
-            raise ValueError("Invalid position format")
-        col = ord(position[0].lower()) - ord('a')
-        row = int(position[1]) - 1
-        return row, col
+        try:
+            return divmod(POS_TO_SQ[position], 8)
+        except KeyError:
+            raise ValueError("Invalid position format") from None
 
     @staticmethod
     def coords_to_position(row, col):
-        return chr(ord('a') + col) + str(row + 1)
-
-    @classmethod
-    def get_piece_moves(cls, piece_type, position, color='white'):
-        row, col = cls.position_to_coords(position)
-        piece_type = piece_type.lower()
-
-        moves = []
-
-        if piece_type == 'rook':
-            moves = cls._get_rook_moves(row, col)
-        elif piece_type == 'bishop':
-            moves = cls._get_bishop_moves(row, col)
-        elif piece_type == 'queen':
-            moves = cls._get_queen_moves(row, col)
-        elif piece_type == 'knight':
-            moves = cls._get_knight_moves(row, col)
-        elif piece_type == 'king':
-            moves = cls._get_king_moves(row, col)
-
-        return [cls.coords_to_position(r, c) for r, c in moves if cls.is_valid_position(r, c)]
-
-    @classmethod
-    def _get_rook_moves(cls, row, col):
-        moves = []
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row, new_col = row + dr * i, col + dc * i
-                if cls.is_valid_position(new_row, new_col):
-                    moves.append((new_row, new_col))
-                else:
-                    break
-        return moves
-
-    @classmethod
-    def _get_bishop_moves(cls, row, col):
-        moves = []
-        directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row, new_col = row + dr * i, col + dc * i
-                if cls.is_valid_position(new_row, new_col):
-                    moves.append((new_row, new_col))
-                else:
-                    break
-        return moves
-
-    @classmethod
-    def _get_queen_moves(cls, row, col):
-        return cls._get_rook_moves(row, col) + cls._get_bishop_moves(row, col)
-
-    @classmethod
-    def _get_knight_moves(cls, row, col):
-        moves = []
-        knight_moves = [
-            (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-            (1, -2), (1, 2), (2, -1), (2, 1)
-        ]
-        for dr, dc in knight_moves:
-            new_row, new_col = row + dr, col + dc
-            if cls.is_valid_position(new_row, new_col):
-                moves.append((new_row, new_col))
-        return moves
-
-    @classmethod
-    def _get_king_moves(cls, row, col):
-        moves = []
-        directions = [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1),           (0, 1),
-            (1, -1),  (1, 0),  (1, 1)
-        ]
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-            if cls.is_valid_position(new_row, new_col):
-                moves.append((new_row, new_col))
-        return moves
-
-    @classmethod
-    def can_attack(cls, piece_type, from_pos, target_pos, color='white'):
-        possible_moves = cls.get_piece_moves(piece_type, from_pos, color)
-        return target_pos in possible_moves
+        return SQ_TO_POS[row * 8 + col]
+
+
+# Chess.PIECE_VALUES indexed by PT, for the analysis hot path
+_PT_VALUES = tuple(Chess.PIECE_VALUES[name] for name in PIECE_NAMES)
+
+# Color ids, used as indexes into COLOR_NAMES and PIECE_SYMBOLS entries
+WHITE, BLACK = 0, 1
+COLOR_NAMES = ('white', 'black')
+
+# Unicode chess symbols as (white, black)
+PIECE_SYMBOLS = {
+    PT.KING: ('♔', '♚'),
+    PT.QUEEN: ('♕', '♛'),
+    PT.ROOK: ('♖', '♜'),
+    PT.BISHOP: ('♗', '♝'),
+    PT.KNIGHT: ('♘', '♞'),
+}
 
 
 class ChessGameGUI:
@@ -117,8 +203,13 @@ class ChessGameGUI:
         self.root.geometry("1000x700")
         self.root.configure(bg='#2c3e50')
         
-        self.chess = Chess()
-        self.board_pieces = {}  # {(row, col): {'piece': 'queen', 'color': 'white'}}
+        self.board_pieces = {}  # {(row, col): (PT.QUEEN, WHITE)}
+        # One bitboard per (color, piece), kept in sync with board_pieces
+        self.bb = {(color, piece): 0 for color in (WHITE, BLACK) for piece in PT}
+        # Square-indexed piece types and per-color occupancy, for analysis without dict lookups
+        self.piece_arr = [None] * 64
+        self.occupancy = [0, 0]
+        self._last_analysis = None  # (state key, analysis text)
         self.selected_piece = None
         self.dragging = False
         self.drag_data = {}
@@ -126,6 +217,9 @@ class ChessGameGUI:
         self.dragging_piece = None
         self.drag_start_pos = None
         
+        # Window/canvas offsets cached at drag start, refreshed if the window moves mid-drag
+        self.root.bind("<Configure>", self.on_configure)
+        
         self.setup_start_screen()
     
     def setup_start_screen(self):
@@ -216,34 +310,25 @@ class ChessGameGUI:
         self.analysis_text.pack(fill=tk.X, pady=(10, 0))
     
     def create_piece_buttons(self, parent):
-        pieces = ['queen', 'rook', 'bishop', 'knight', 'king']
-        colors = ['white', 'black']
-        
-        # Unicode chess symbols
-        piece_symbols = {
-            'king': {'white': '♔', 'black': '♚'},
-            'queen': {'white': '♕', 'black': '♛'},
-            'rook': {'white': '♖', 'black': '♜'},
-            'bishop': {'white': '♗', 'black': '♝'},
-            'knight': {'white': '♘', 'black': '♞'},
-        }
+        pieces = [PT.QUEEN, PT.ROOK, PT.BISHOP, PT.KNIGHT, PT.KING]
+        colors = [WHITE, BLACK]
         
         for color in colors:
             color_frame = tk.Frame(parent, bg='#34495e')
             color_frame.pack(fill=tk.X, pady=5)
             
-            color_label = tk.Label(color_frame, text=f"{color.title()} Pieces", 
+            color_label = tk.Label(color_frame, text=f"{COLOR_NAMES[color].title()} Pieces", 
                                   font=('Arial', 12, 'bold'),
-                                  fg='white' if color == 'white' else '#bdc3c7', 
+                                  fg='white' if color == WHITE else '#bdc3c7', 
                                   bg='#34495e')
             color_label.pack()
             
             for piece in pieces:
-                symbol = piece_symbols[piece][color]
-                btn = tk.Button(color_frame, text=f"{symbol} {piece.title()}", 
+                symbol = PIECE_SYMBOLS[piece][color]
+                btn = tk.Button(color_frame, text=f"{symbol} {PIECE_NAMES[piece].title()}", 
                                font=('Arial', 14),
-                               bg='white' if color == 'white' else '#2c3e50',
-                               fg='black' if color == 'white' else 'white',
+                               bg='white' if color == WHITE else '#2c3e50',
+                               fg='black' if color == WHITE else 'white',
                                width=15)
                 # Store button reference
                 self.piece_buttons.append(btn)
@@ -259,9 +344,9 @@ class ChessGameGUI:
         for btn in self.piece_buttons:
             btn.config(relief='raised')
         
-        self.selected_piece = {'piece': piece, 'color': color}
+        self.selected_piece = (piece, color)
         button.config(relief='sunken')
-        print(f"Selected: {color} {piece}")  # Debug feedback
+        print(f"Selected: {COLOR_NAMES[color]} {PIECE_NAMES[piece]}")  # Debug feedback
     
     def create_board(self, parent):
         self.board_frame = tk.Frame(parent, bg='#2c3e50')
@@ -272,7 +357,25 @@ class ChessGameGUI:
                                highlightbackground='#34495e')
         self.canvas.pack()
         
-        # Draw the chess board
+        # Squares and coordinates never change, so they are drawn once here
+        self.square_ids = [[None] * 8 for _ in range(8)]
+        for row in range(8):
+            for col in range(8):
+                x1, y1 = col * 60, row * 60
+                x2, y2 = x1 + 60, y1 + 60
+                
+                color = "#f0d9b5" if (row + col) % 2 == 0 else "#b58863"
+                self.square_ids[row][col] = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="#8b4513")
+        
+        for i in range(8):
+            # Column labels (a-h)
+            self.canvas.create_text(i * 60 + 30, 490, text=chr(ord('a') + i), 
+                                   font=('Arial', 10), fill='#2c3e50')
+            # Row labels (1-8)
+            self.canvas.create_text(490, (7-i) * 60 + 30, text=str(i + 1), 
+                                   font=('Arial', 10), fill='#2c3e50')
+        
+        # Draw the pieces
         self.draw_board()
         
         # Bind mouse events
@@ -284,77 +387,58 @@ class ChessGameGUI:
         self.canvas.bind("<Motion>", self.on_canvas_motion)
     
     def draw_board(self):
-        self.canvas.delete("all")
+        # Only the pieces are redrawn; squares are created once in create_board
+        self.canvas.delete("piece")
         
-        # Draw squares
-        for row in range(8):
-            for col in range(8):
-                x1, y1 = col * 60, row * 60
-                x2, y2 = x1 + 60, y1 + 60
-                
-                color = "#f0d9b5" if (row + col) % 2 == 0 else "#b58863"
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="#8b4513")
-        
-        # Draw pieces
-        piece_symbols = {
-            'king': {'white': '♔', 'black': '♚'},
-            'queen': {'white': '♕', 'black': '♛'},
-            'rook': {'white': '♖', 'black': '♜'},
-            'bishop': {'white': '♗', 'black': '♝'},
-            'knight': {'white': '♘', 'black': '♞'},
-        }
-        
-        for (row, col), piece_info in self.board_pieces.items():
+        for (row, col), (piece, color) in self.board_pieces.items():
             x, y = col * 60 + 30, row * 60 + 30
-            symbol = piece_symbols[piece_info['piece']][piece_info['color']]
-            color = 'black' if piece_info['color'] == 'black' else '#2c3e50'
+            symbol = PIECE_SYMBOLS[piece][color]
+            fill = 'black' if color == BLACK else '#2c3e50'
             
             self.canvas.create_text(x, y, text=symbol, font=('Arial', 36), 
-                                   fill=color, tags=f"piece_{row}_{col}")
-        
-        # Draw coordinates
-        for i in range(8):
-            # Column labels (a-h)
-            self.canvas.create_text(i * 60 + 30, 490, text=chr(ord('a') + i), 
-                                   font=('Arial', 10), fill='#2c3e50')
-            # Row labels (1-8)
-            self.canvas.create_text(490, (7-i) * 60 + 30, text=str(i + 1), 
-                                   font=('Arial', 10), fill='#2c3e50')
+                                   fill=fill, tags=("piece", f"piece_{row}_{col}"))
     
     def start_drag_from_button(self, event, piece, color):
         """Start dragging a piece from the button panel"""
-        self.dragging_piece = {'piece': piece, 'color': color}
+        self.dragging_piece = (piece, color)
         self.drag_start_pos = (event.x_root, event.y_root)
         self.dragging = True
+        self._cache_geometry()
         
         # Create a temporary label to show what's being dragged
-        piece_symbols = {
-            'king': {'white': '♔', 'black': '♚'},
-            'queen': {'white': '♕', 'black': '♛'},
-            'rook': {'white': '♖', 'black': '♜'},
-            'bishop': {'white': '♗', 'black': '♝'},
-            'knight': {'white': '♘', 'black': '♞'},
-        }
-        
         if hasattr(self, 'drag_label'):
             self.drag_label.destroy()
         
         self.drag_label = tk.Label(self.root, 
-                                  text=piece_symbols[piece][color],
+                                  text=PIECE_SYMBOLS[piece][color],
                                   font=('Arial', 36),
                                   fg='red',
                                   bg='white',
                                   relief='raised',
                                   bd=2)
-        self.drag_label.place(x=event.x_root - self.root.winfo_rootx(), 
-                             y=event.y_root - self.root.winfo_rooty())
+        self.drag_label.place(x=event.x_root - self._root_x, 
+                             y=event.y_root - self._root_y)
         self.drag_label.lift()
     
     def drag_piece(self, event):
         """Update position of dragged piece"""
         if self.dragging and hasattr(self, 'drag_label'):
-            self.drag_label.place(x=event.x_root - self.root.winfo_rootx() - 20, 
-                                 y=event.y_root - self.root.winfo_rooty() - 20)
+            self.drag_label.place(x=event.x_root - self._root_x - 20, 
+                                 y=event.y_root - self._root_y - 20)
+    
+    def _cache_geometry(self):
+        """Read window and canvas offsets once so motion events need no Tk queries"""
+        self._root_x = self.root.winfo_rootx()
+        self._root_y = self.root.winfo_rooty()
+        self._canvas_x = self.canvas.winfo_x()
+        self._canvas_y = self.canvas.winfo_y()
+    
+    def on_configure(self, event):
+        """Refresh cached offsets if the window moves or resizes during a drag"""
+        # The toplevel binding also fires for child widgets, including drag_label
+        # every time it is placed; only the window itself should refresh the cache
+        if event.widget is self.root and self.dragging:
+            self._cache_geometry()
     
     def drop_piece(self, event):
         """Handle dropping a piece"""
@@ -375,7 +459,7 @@ class ChessGameGUI:
             
             if 0 <= row < 8 and 0 <= col < 8:
                 # Place the piece
-                self.board_pieces[(row, col)] = self.dragging_piece.copy()
+                self._place_piece(row, col, self.dragging_piece)
                 self.draw_board()
         
         # Clean up
@@ -392,48 +476,42 @@ class ChessGameGUI:
         if 0 <= row < 8 and 0 <= col < 8:
             if (row, col) in self.board_pieces:
                 # Start dragging existing piece
-                self.dragging_piece = self.board_pieces[(row, col)].copy()
+                self.dragging_piece = self.board_pieces[(row, col)]
                 self.drag_start_board_pos = (row, col)
                 self.dragging = True
+                self._cache_geometry()
                 
-                # Remove piece from board temporarily
-                del self.board_pieces[(row, col)]
-                self.draw_board()
+                # Remove piece from board temporarily, hiding its canvas item
+                self._remove_piece(row, col)
+                self.canvas.itemconfigure(f"piece_{row}_{col}", state='hidden')
                 
                 # Create drag label
-                piece_symbols = {
-                    'king': {'white': '♔', 'black': '♚'},
-                    'queen': {'white': '♕', 'black': '♛'},
-                    'rook': {'white': '♖', 'black': '♜'},
-                    'bishop': {'white': '♗', 'black': '♝'},
-                    'knight': {'white': '♘', 'black': '♞'},
-                }
-                
                 if hasattr(self, 'drag_label'):
                     self.drag_label.destroy()
                 
+                piece, color = self.dragging_piece
                 self.drag_label = tk.Label(self.root, 
-                                          text=piece_symbols[self.dragging_piece['piece']][self.dragging_piece['color']],
+                                          text=PIECE_SYMBOLS[piece][color],
                                           font=('Arial', 36),
                                           fg='red',
                                           bg='white',
                                           relief='raised',
                                           bd=2)
-                self.drag_label.place(x=event.x + self.canvas.winfo_x(), 
-                                     y=event.y + self.canvas.winfo_y())
+                self.drag_label.place(x=event.x + self._canvas_x, 
+                                     y=event.y + self._canvas_y)
                 self.drag_label.lift()
     
     def on_canvas_motion(self, event):
         """Handle mouse motion over canvas"""
         if self.dragging and hasattr(self, 'drag_label'):
-            self.drag_label.place(x=event.x + self.canvas.winfo_x() - 20, 
-                                 y=event.y + self.canvas.winfo_y() - 20)
+            self.drag_label.place(x=event.x + self._canvas_x - 20, 
+                                 y=event.y + self._canvas_y - 20)
     
     def on_drag(self, event):
         """Handle dragging motion"""
         if self.dragging and hasattr(self, 'drag_label'):
-            self.drag_label.place(x=event.x + self.canvas.winfo_x() - 20, 
-                                 y=event.y + self.canvas.winfo_y() - 20)
+            self.drag_label.place(x=event.x + self._canvas_x - 20, 
+                                 y=event.y + self._canvas_y - 20)
     
     def on_release(self, event):
         """Handle mouse release on canvas"""
@@ -442,13 +520,15 @@ class ChessGameGUI:
             
         col = event.x // 60
         row = event.y // 60
+        start = getattr(self, 'drag_start_board_pos', None)
         
         if 0 <= row < 8 and 0 <= col < 8:
             # Place the piece
-            self.board_pieces[(row, col)] = self.dragging_piece.copy()
-        elif hasattr(self, 'drag_start_board_pos'):
+            self._place_piece(row, col, self.dragging_piece)
+        elif start is not None:
             # Return piece to original position if dropped outside board
-            self.board_pieces[self.drag_start_board_pos] = self.dragging_piece.copy()
+            self._place_piece(*start, self.dragging_piece)
+            row, col = start
         
         # Clean up
         if hasattr(self, 'drag_label'):
@@ -458,91 +538,130 @@ class ChessGameGUI:
         
         self.dragging = False
         self.dragging_piece = None
-        self.draw_board()
+        
+        if (row, col) == start:
+            # Piece is back on its own square, so its hidden item is still valid
+            self.canvas.itemconfigure(f"piece_{row}_{col}", state='normal')
+        else:
+            self.draw_board()
+    
+    def _place_piece(self, row, col, piece_info):
+        """Put a piece on a square, replacing whatever was there"""
+        if (row, col) in self.board_pieces:
+            self._remove_piece(row, col)
+        self.board_pieces[(row, col)] = piece_info
+        piece, color = piece_info
+        sq = row * 8 + col
+        self.bb[(color, piece)] |= 1 << sq
+        self.piece_arr[sq] = piece
+        self.occupancy[color] |= 1 << sq
+    
+    def _remove_piece(self, row, col):
+        piece, color = self.board_pieces.pop((row, col))
+        sq = row * 8 + col
+        self.bb[(color, piece)] &= ~(1 << sq)
+        self.piece_arr[sq] = None
+        self.occupancy[color] &= ~(1 << sq)
     
     def clear_board(self):
         self.board_pieces.clear()
+        self.bb = dict.fromkeys(self.bb, 0)
+        self.piece_arr = [None] * 64
+        self.occupancy = [0, 0]
         self.draw_board()
     
+    def _state_key(self):
+        """Whole position as a tuple of bitboards, cheap to hash and compare"""
+        return tuple(self.bb.values())
+    
     def analyze_position(self):
         if len(self.board_pieces) < 2:
             messagebox.showinfo("Not Enough Pieces", "Place at least 2 pieces on the board to analyze!")
             return
         
-        analysis_text = "=== CHESS POSITION ANALYSIS ===\n\n"
+        # Repeated clicks on an unchanged board reuse the previous analysis
+        state = self._state_key()
+        if self._last_analysis is None or self._last_analysis[0] != state:
+            self._last_analysis = (state, self._build_analysis())
         
-        # List all pieces
+        # Display analysis
+        self.analysis_text.delete(1.0, tk.END)
+        self.analysis_text.insert(1.0, self._last_analysis[1])
+    
+    def _build_analysis(self):
+        parts = ["=== CHESS POSITION ANALYSIS ===\n\n"]
+        
+        white_occ = self.occupancy[WHITE]
+        black_occ = self.occupancy[BLACK]
+        occupancy = white_occ | black_occ
+        
+        # List all pieces in square order, computing each piece's attack bitboard once
         pieces_by_color = {'white': [], 'black': []}
-        for (row, col), piece_info in self.board_pieces.items():
-            pos = self.chess.coords_to_position(row, col)
-            pieces_by_color[piece_info['color']].append({
-                'piece': piece_info['piece'],
-                'position': pos,
-                'coords': (row, col)
-            })
-        
-        analysis_text += f"White pieces: {len(pieces_by_color['white'])}\n"
+        for color, occ in (('white', white_occ), ('black', black_occ)):
+            for sq in _squares(occ):
+                piece = self.piece_arr[sq]
+                pieces_by_color[color].append({
+                    'piece': piece,
+                    'position': SQ_TO_POS[sq],
+                    'attacks': ATTACKS[piece](sq, occupancy)
+                })
+        
+        parts.append(f"White pieces: {len(pieces_by_color['white'])}\n")
         for piece in pieces_by_color['white']:
-            analysis_text += f"  {piece['piece'].title()} at {piece['position']}\n"
+            parts.append(f"  {PIECE_NAMES[piece['piece']].title()} at {piece['position']}\n")
         
-        analysis_text += f"\nBlack pieces: {len(pieces_by_color['black'])}\n"
+        parts.append(f"\nBlack pieces: {len(pieces_by_color['black'])}\n")
         for piece in pieces_by_color['black']:
-            analysis_text += f"  {piece['piece'].title()} at {piece['position']}\n"
+            parts.append(f"  {PIECE_NAMES[piece['piece']].title()} at {piece['position']}\n")
         
         # Analyze attacks
-        analysis_text += "\n=== ATTACK ANALYSIS ===\n"
+        parts.append("\n=== ATTACK ANALYSIS ===\n")
         white_attacks = 0
         black_attacks = 0
         
         for white_piece in pieces_by_color['white']:
-            for black_piece in pieces_by_color['black']:
-                if self.chess.can_attack(white_piece['piece'], white_piece['position'], 
-                                       black_piece['position'], 'white'):
-                    analysis_text += f"White {white_piece['piece']} at {white_piece['position']} can attack Black {black_piece['piece']} at {black_piece['position']}\n"
-                    white_attacks += 1
+            for sq in _squares(white_piece['attacks'] & black_occ):
+                parts.append(f"White {PIECE_NAMES[white_piece['piece']]} at {white_piece['position']} can attack Black {PIECE_NAMES[self.piece_arr[sq]]} at {SQ_TO_POS[sq]}\n")
+                white_attacks += 1
         
         for black_piece in pieces_by_color['black']:
-            for white_piece in pieces_by_color['white']:
-                if self.chess.can_attack(black_piece['piece'], black_piece['position'], 
-                                       white_piece['position'], 'black'):
-                    analysis_text += f"Black {black_piece['piece']} at {black_piece['position']} can attack White {white_piece['piece']} at {white_piece['position']}\n"
-                    black_attacks += 1
+            for sq in _squares(black_piece['attacks'] & white_occ):
+                parts.append(f"Black {PIECE_NAMES[black_piece['piece']]} at {black_piece['position']} can attack White {PIECE_NAMES[self.piece_arr[sq]]} at {SQ_TO_POS[sq]}\n")
+                black_attacks += 1
         
         if white_attacks == 0 and black_attacks == 0:
-            analysis_text += "No pieces can attack each other.\n"
+            parts.append("No pieces can attack each other.\n")
         
         # Calculate material advantage
-        white_value = sum(self.chess.PIECE_VALUES[p['piece']] for p in pieces_by_color['white'])
-        black_value = sum(self.chess.PIECE_VALUES[p['piece']] for p in pieces_by_color['black'])
+        white_value = sum(_PT_VALUES[p['piece']] for p in pieces_by_color['white'])
+        black_value = sum(_PT_VALUES[p['piece']] for p in pieces_by_color['black'])
         
-        analysis_text += f"\n=== MATERIAL COUNT ===\n"
-        analysis_text += f"White total value: {white_value}\n"
-        analysis_text += f"Black total value: {black_value}\n"
+        parts.append(f"\n=== MATERIAL COUNT ===\n")
+        parts.append(f"White total value: {white_value}\n")
+        parts.append(f"Black total value: {black_value}\n")
         
         if white_value > black_value:
-            analysis_text += f"White has material advantage: +{white_value - black_value}\n"
+            parts.append(f"White has material advantage: +{white_value - black_value}\n")
         elif black_value > white_value:
-            analysis_text += f"Black has material advantage: +{black_value - white_value}\n"
+            parts.append(f"Black has material advantage: +{black_value - white_value}\n")
         else:
-            analysis_text += "Material is equal\n"
+            parts.append("Material is equal\n")
         
         # Determine winner
-        analysis_text += f"\n=== WINNER PREDICTION ===\n"
+        parts.append(f"\n=== WINNER PREDICTION ===\n")
         if white_attacks > black_attacks:
-            analysis_text += "White has tactical advantage (more attacks)\n"
+            parts.append("White has tactical advantage (more attacks)\n")
         elif black_attacks > white_attacks:
-            analysis_text += "Black has tactical advantage (more attacks)\n"
+            parts.append("Black has tactical advantage (more attacks)\n")
         
         if white_value > black_value and white_attacks >= black_attacks:
-            analysis_text += "🏆 WHITE IS LIKELY TO WIN\n"
+            parts.append("🏆 WHITE IS LIKELY TO WIN\n")
         elif black_value > white_value and black_attacks >= white_attacks:
-            analysis_text += "🏆 BLACK IS LIKELY TO WIN\n"
+            parts.append("🏆 BLACK IS LIKELY TO WIN\n")
         else:
-            analysis_text += "🤝 POSITION IS ROUGHLY EQUAL\n"
+            parts.append("🤝 POSITION IS ROUGHLY EQUAL\n")
         
-        # Display analysis
-        self.analysis_text.delete(1.0, tk.END)
-        self.analysis_text.insert(1.0, analysis_text)
+        return "".join(parts)
 
 
 def main():